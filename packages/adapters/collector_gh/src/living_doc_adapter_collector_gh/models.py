@@ -17,6 +17,8 @@ class CompatibilityWarning(BaseModel):
     message: str
     context: str | None = None
 
+    model_config = {"frozen": True}
+
 
 class AdapterItemTimestamps(BaseModel):
     """Timestamps for an adapter item."""
@@ -24,6 +26,8 @@ class AdapterItemTimestamps(BaseModel):
     created: str
     updated: str
 
+    model_config = {"frozen": True}
+
 
 class AdapterItem(BaseModel):
     """Represents a single item (issue) from the collector output."""
@@ -36,6 +40,8 @@ class AdapterItem(BaseModel):
     timestamps: AdapterItemTimestamps
     body: str | None = None
 
+    model_config = {"frozen": True}
+
 
 class AdapterMetadataProducer(BaseModel):
     """Producer information for adapter metadata."""
@@ -44,6 +50,8 @@ class AdapterMetadataProducer(BaseModel):
     version: str
     build: str | None
 
+    model_config = {"frozen": True}
+
 
 class AdapterMetadataRun(BaseModel):
     """Run information for adapter metadata."""
@@ -55,6 +63,8 @@ class AdapterMetadataRun(BaseModel):
     ref: str | None
     sha: str | None
 
+    model_config = {"frozen": True}
+
 
 class AdapterMetadataSource(BaseModel):
     """Source information for adapter metadata."""
@@ -64,6 +74,8 @@ class AdapterMetadataSource(BaseModel):
     organization: str | None
     enterprise: str | None
 
+    model_config = {"frozen": True}
+
 
 class AdapterMetadata(BaseModel):
     """Metadata information from the adapter."""
@@ -73,6 +85,8 @@ class AdapterMetadata(BaseModel):
     source: AdapterMetadataSource
     original_metadata: dict
 
+    model_config = {"frozen": True}
+
 
 class AdapterResult(BaseModel):
     """Complete result from adapter parsing."""
@@ -80,3 +94,5 @@ class AdapterResult(BaseModel):
     items: list[AdapterItem]
     metadata: AdapterMetadata
     warnings: list[CompatibilityWarning]
+
+    model_config = {"frozen": True}
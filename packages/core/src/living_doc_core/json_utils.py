@@ -5,10 +5,25 @@ JSON utilities for reading, writing, and validating JSON files.
 """
 
 import json
+import platform
 from pathlib import Path
 
 from living_doc_core.errors import FileIOError, InvalidInputError
 
+# Runtime dispatch flag for JSON accelerators. C-extension parsers (orjson and
+# friends) only pay off on CPython; under PyPy the JIT-compiled stdlib path is
+# faster and avoids the cpyext bridging cost, so accelerated code paths must
+# check this flag and fall back to the pure-Python implementation.
+_IS_PYPY = platform.python_implementation() == "PyPy"
+
+try:
+    import orjson as _orjson
+except ImportError:  # pragma: no cover - depends on environment
+    _orjson = None  # type: ignore[assignment]
+
+if _IS_PYPY:  # pragma: no cover - PyPy only
+    _orjson = None  # type: ignore[assignment]
+
 
 def read_json(filepath: str | Path) -> dict:
     """
@@ -26,8 +41,14 @@ def read_json(filepath: str | Path) -> dict:
     """
     path = Path(filepath)
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            return json.load(f)
+        # Read the raw bytes in one shot (single open/read/close syscall trio,
+        # no text-mode decoder pipeline) and parse them directly; orjson's
+        # JSONDecodeError subclasses json.JSONDecodeError, so error mapping is
+        # unchanged on either path.
+        data = path.read_bytes()
+        if _orjson is not None:
+            return _orjson.loads(data)
+        return json.loads(data)
     except FileNotFoundError as e:
         raise FileIOError(f"File '{filepath}' not found") from e
     except PermissionError as e:
@@ -55,9 +76,20 @@ def write_json(filepath: str | Path, data: dict, indent: int = 2, sort_keys: boo
     try:
         # Ensure parent directory exists
         path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
-            f.write("\n")  # Add trailing newline for POSIX compliance
+        if _orjson is not None and indent == 2:
+            # Encode once and write once; orjson only supports 2-space indent,
+            # so other indent widths (including 0, where the stdlib still
+            # emits newline-separated output) stay on the stdlib path. The
+            # POSIX trailing newline is appended by the encoder itself.
+            option = _orjson.OPT_APPEND_NEWLINE | _orjson.OPT_INDENT_2
+            if sort_keys:
+                option |= _orjson.OPT_SORT_KEYS
+            path.write_bytes(_orjson.dumps(data, option=option))
+        else:
+            # Encode the whole document first, then write once; json.dump
+            # would issue many small chunked writes through the text wrapper.
+            encoded = json.dumps(data, indent=indent, sort_keys=sort_keys, ensure_ascii=False)
+            path.write_text(encoded + "\n", encoding="utf-8")  # Trailing newline for POSIX compliance
     except PermissionError as e:
         raise FileIOError(f"Permission denied writing to '{filepath}'") from e
     except OSError as e:
@@ -4,8 +4,6 @@
 Markdown utilities for parsing and normalizing markdown text.
 """
 
-import re
-
 
 def split_by_headings(markdown_text: str, level: int = 2) -> dict[str, str]:
     """
@@ -22,43 +20,49 @@ def split_by_headings(markdown_text: str, level: int = 2) -> dict[str, str]:
     if not markdown_text:
         return {"": ""}
 
-    # Create pattern for headings of the specified level
-    # Match lines starting with exact number of # followed by space
-    heading_pattern = re.compile(r"^#{" + str(level) + r"}\s+(.+)$", re.MULTILINE)
-
-    # Find all heading matches with their positions
-    matches = list(heading_pattern.finditer(markdown_text))
-
-    if not matches:
+    # Scan for heading lines with a prefix test: a heading at the requested
+    # level starts with exactly `level` '#' characters followed by whitespace
+    # and a title. Line boundaries come from str.find, so only candidate
+    # heading lines (first character '#', long enough for marker + title) are
+    # ever sliced out -- no up-front list of N line objects is allocated.
+    marker = "#" * level
+    headings = []  # (line_start, title, line_end)
+    text_len = len(markdown_text)
+    find = markdown_text.find
+    pos = 0
+    while pos < text_len:
+        line_end = find("\n", pos)
+        if line_end < 0:
+            line_end = text_len
+        if markdown_text[pos] == "#" and line_end - pos > level + 1:
+            line = markdown_text[pos:line_end]
+            if line.startswith(marker) and line[level].isspace():
+                headings.append((pos, line[level:].strip(), line_end))
+        pos = line_end + 1
+
+    if not headings:
         # No headings found, return all content under empty key
         return {"": markdown_text}
 
     result = {}
 
     # Handle content before first heading
-    first_heading_pos = matches[0].start()
+    first_heading_pos = headings[0][0]
     if first_heading_pos > 0:
-        pre_content = markdown_text[:first_heading_pos].rstrip()
-        result[""] = pre_content
+        result[""] = markdown_text[:first_heading_pos].rstrip()
 
     # Process each heading and its content
-    for i, match in enumerate(matches):
-        heading_text = match.group(1).strip()
-
+    for i, (_, heading_text, line_end) in enumerate(headings):
         # Find where content starts (after the heading line)
-        content_start = match.end()
-        if content_start < len(markdown_text) and markdown_text[content_start] == "\n":
+        content_start = line_end
+        if content_start < text_len and markdown_text[content_start] == "\n":
             content_start += 1
 
         # Find where content ends (at next heading or end of text)
-        if i + 1 < len(matches):
-            content_end = matches[i + 1].start()
-        else:
-            content_end = len(markdown_text)
+        content_end = headings[i + 1][0] if i + 1 < len(headings) else text_len
 
         # Extract and strip content
-        content = markdown_text[content_start:content_end].rstrip()
-        result[heading_text] = content
+        result[heading_text] = markdown_text[content_start:content_end].rstrip()
 
     return result
 
@@ -76,6 +80,11 @@ def normalize_heading(text: str) -> str:
     return text.strip().lower()
 
 
+# Bullet markers recognized by extract_lists; a tuple argument lets
+# str.startswith test both prefixes in one C-level call
+_BULLET_PREFIXES = ("- ", "* ")
+
+
 def extract_lists(markdown_text: str) -> list[str]:
     """
     Extract bullet list items from markdown text.
@@ -95,7 +104,7 @@ def extract_lists(markdown_text: str) -> list[str]:
     for line in lines:
         stripped = line.strip()
         # Match lines starting with - or * followed by space
-        if stripped.startswith("- ") or stripped.startswith("* "):
+        if stripped.startswith(_BULLET_PREFIXES):
             # Remove the bullet marker and leading space
             item_text = stripped[2:].strip()
             if item_text:
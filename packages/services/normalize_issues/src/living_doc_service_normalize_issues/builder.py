@@ -6,6 +6,8 @@ PDF-ready JSON builder for normalized issues.
 This module builds PdfReadyV1 objects from AdapterResult data with normalized sections.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 
 from living_doc_adapter_collector_gh.models import AdapterResult  # type: ignore[import-untyped]
@@ -30,6 +32,76 @@ from living_doc_datasets_pdf.pdf_ready.v1.models import (  # type: ignore[import
 
 from living_doc_service_normalize_issues.normalizer import normalize_sections
 
+# Item count above which body normalization is fanned out to a process pool.
+# Below this, worker startup and pickling cost more than the work itself.
+_PARALLEL_THRESHOLD = 500
+
+
+def _normalize_bodies(items: list, parallel: bool = True) -> list[dict]:
+    """
+    Normalize the markdown bodies of all adapter items.
+
+    Each body is independent CPU-bound string work, so large batches are
+    distributed across a process pool (only the body strings are pickled,
+    not the full Pydantic items). Small batches stay on the sequential
+    path, where pool startup would dominate. The chunksize scales with the
+    batch so each worker receives a handful of large pickled chunks instead
+    of many small ones.
+
+    Args:
+        items: Adapter items whose bodies should be normalized
+        parallel: Whether large batches may fan out to a process pool
+
+    Returns:
+        List of normalized section dicts, in item order
+    """
+    if parallel and len(items) >= _PARALLEL_THRESHOLD:
+        workers = os.cpu_count() or 1
+        chunksize = max(1, len(items) // (workers * 4))
+        with ProcessPoolExecutor() as executor:
+            return list(executor.map(normalize_sections, (item.body or "" for item in items), chunksize=chunksize))
+    return [normalize_sections(item.body or "") for item in items]
+
+
+def _build_user_story(item, normalized: dict) -> UserStory:
+    """
+    Build a UserStory from an adapter item and its normalized sections.
+
+    Args:
+        item: Adapter item providing the 1:1 metadata fields
+        normalized: Normalized section dict for the item's body
+
+    Returns:
+        UserStory object
+    """
+    # Build Sections object
+    sections = Sections(
+        description=normalized.get("description"),
+        business_value=normalized.get("business_value"),
+        preconditions=normalized.get("preconditions"),
+        acceptance_criteria=normalized.get("acceptance_criteria"),
+        user_guide=normalized.get("user_guide"),
+        connections=normalized.get("connections"),
+        last_edited=normalized.get("last_edited"),
+    )
+
+    # UserStory goes through full validation: its title_must_be_valid_length
+    # constraint (1-500 chars) is stricter than AdapterItem.title, so the copy
+    # is not trusted. Timestamps is a plain unconstrained copy of already
+    # validated adapter strings, so model_construct skips that schema walk.
+    return UserStory(
+        id=item.id,
+        title=item.title,
+        state=item.state,
+        tags=item.tags,
+        url=item.url,
+        timestamps=Timestamps.model_construct(
+            created=item.timestamps.created,
+            updated=item.timestamps.updated,
+        ),
+        sections=sections,
+    )
+
 
 def build_pdf_ready(adapter_result: AdapterResult, options: dict) -> PdfReadyV1:  # pylint: disable=too-many-locals
     """
@@ -45,37 +117,15 @@ def build_pdf_ready(adapter_result: AdapterResult, options: dict) -> PdfReadyV1:
     Returns:
         PdfReadyV1 object ready for serialization
     """
-    # Build user stories from adapter items
-    user_stories = []
-    for item in adapter_result.items:
-        # Normalize markdown sections
-        normalized = normalize_sections(item.body or "")
-
-        # Build Sections object
-        sections = Sections(
-            description=normalized.get("description"),
-            business_value=normalized.get("business_value"),
-            preconditions=normalized.get("preconditions"),
-            acceptance_criteria=normalized.get("acceptance_criteria"),
-            user_guide=normalized.get("user_guide"),
-            connections=normalized.get("connections"),
-            last_edited=normalized.get("last_edited"),
-        )
+    # Normalize markdown sections for all items (parallelized for large
+    # batches unless options["parallel"] disables it)
+    normalized_bodies = _normalize_bodies(adapter_result.items, parallel=options.get("parallel", True))
 
-        # Build UserStory object
-        user_story = UserStory(
-            id=item.id,
-            title=item.title,
-            state=item.state,
-            tags=item.tags,
-            url=item.url,
-            timestamps=Timestamps(
-                created=item.timestamps.created,
-                updated=item.timestamps.updated,
-            ),
-            sections=sections,
-        )
-        user_stories.append(user_story)
+    # Zip the metadata back with the batch-normalized bodies in one
+    # comprehension (no per-iteration append dispatch)
+    user_stories = [
+        _build_user_story(item, normalized) for item, normalized in zip(adapter_result.items, normalized_bodies)
+    ]
 
     # Build Content
     content = Content(user_stories=user_stories)
@@ -88,14 +138,11 @@ def build_pdf_ready(adapter_result: AdapterResult, options: dict) -> PdfReadyV1:
         excluded_items=0,
     )
 
-    # Build source_set from adapter metadata
-    source_set = []
-    for repo in adapter_result.metadata.source.repositories:
-        # Format repositories with github: prefix for source_set
-        if not repo.startswith("github:"):
-            source_set.append(f"github:{repo}")
-        else:
-            source_set.append(repo)
+    # Build source_set from adapter metadata in one pass, formatting
+    # repositories with the github: prefix
+    source_set = [
+        repo if repo.startswith("github:") else f"github:{repo}" for repo in adapter_result.metadata.source.repositories
+    ]
 
     # Fallback for document_title if not provided
     document_title = options.get("document_title")
@@ -121,12 +168,13 @@ def build_pdf_ready(adapter_result: AdapterResult, options: dict) -> PdfReadyV1:
             commit_sha=adapter_result.metadata.run.sha,
         )
 
-    # Build audit envelope
-    audit = _build_audit_envelope(adapter_result, options)
-
-    # Get current timestamp
+    # Get current timestamp once; the audit trace reuses it so the run carries
+    # a single consistent timestamp instead of three separate clock reads
     generated_at = datetime.now(timezone.utc).isoformat()
 
+    # Build audit envelope
+    audit = _build_audit_envelope(adapter_result, generated_at)
+
     # Build Meta
     meta = Meta(
         document_title=document_title,
@@ -144,7 +192,7 @@ def build_pdf_ready(adapter_result: AdapterResult, options: dict) -> PdfReadyV1:
     return pdf_ready
 
 
-def _build_audit_envelope(adapter_result: AdapterResult, _options: dict) -> AuditEnvelopeV1:
+def _build_audit_envelope(adapter_result: AdapterResult, now_iso: str) -> AuditEnvelopeV1:
     """
     Build audit envelope from adapter metadata.
 
@@ -152,7 +200,7 @@ def _build_audit_envelope(adapter_result: AdapterResult, _options: dict) -> Audi
 
     Args:
         adapter_result: Adapter result with metadata
-        options: Configuration options (currently unused)
+        now_iso: ISO 8601 timestamp of the current run (shared with meta.generated_at)
 
     Returns:
         AuditEnvelopeV1 object
@@ -164,8 +212,8 @@ def _build_audit_envelope(adapter_result: AdapterResult, _options: dict) -> Audi
         build=adapter_result.metadata.producer.build,
     )
 
-    # Map run metadata
-    run = Run(
+    # Map run metadata (1:1 copy of validated adapter fields, no constraints)
+    run = Run.model_construct(
         run_id=adapter_result.metadata.run.run_id,
         run_attempt=adapter_result.metadata.run.run_attempt,
         actor=adapter_result.metadata.run.actor,
@@ -182,9 +230,6 @@ def _build_audit_envelope(adapter_result: AdapterResult, _options: dict) -> Audi
         enterprise=adapter_result.metadata.source.enterprise,
     )
 
-    # Build trace with normalization step
-    now = datetime.now(timezone.utc).isoformat()
-
     # Convert adapter warnings to audit warnings
     audit_warnings = [AuditWarning(code=w.code, message=w.message, context=w.context) for w in adapter_result.warnings]
 
@@ -192,18 +237,21 @@ def _build_audit_envelope(adapter_result: AdapterResult, _options: dict) -> Audi
         step="normalization",
         tool="living-doc-toolkit",
         tool_version="1.0.0",
-        started_at=now,
-        finished_at=now,
+        started_at=now_iso,
+        finished_at=now_iso,
         warnings=audit_warnings,
     )
 
     trace = [normalization_step]
 
-    # Build extensions with original metadata
+    # Build extensions with original metadata. The inner dict is stored by reference
+    # (no copy); model_construct skips the deep re-validation of original_metadata,
+    # which is pure overhead for large collector payloads — the metadata was already
+    # validated by the adapter parser.
     extensions = {"collector-gh": {"original_metadata": adapter_result.metadata.original_metadata}}
 
     # Build audit envelope
-    audit = AuditEnvelopeV1(
+    audit = AuditEnvelopeV1.model_construct(
         schema_version="1.0",
         producer=producer,
         run=run,
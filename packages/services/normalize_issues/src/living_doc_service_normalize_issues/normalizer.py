@@ -6,6 +6,9 @@ Markdown normalizer for user story sections.
 This module handles parsing markdown content and normalizing headings to canonical section names.
 """
 
+import functools
+import sys
+
 from living_doc_core.markdown_utils import (  # type: ignore[import-untyped]
     normalize_heading,
     split_by_headings,
@@ -22,8 +25,17 @@ HEADING_SYNONYMS = {
     "last_edited": ["last edited", "history", "changes"],
 }
 
+# Reverse synonym -> canonical lookup, computed once at import time. The
+# forward table above stays the public editing surface; this derived map is
+# what the hot loop in normalize_sections actually consults. Keys are
+# interned so lookups against likewise-interned heading text resolve on a
+# pointer-identity compare inside the dict probe.
+_SYNONYM_TO_CANONICAL = {
+    sys.intern(synonym): canonical for canonical, synonyms in HEADING_SYNONYMS.items() for synonym in synonyms
+}
+
 
-def normalize_sections(markdown: str) -> dict:  # pylint: disable=too-many-branches
+def normalize_sections(markdown: str) -> dict[str, str | None]:
     """
     Normalize markdown content into canonical sections.
 
@@ -31,6 +43,11 @@ def normalize_sections(markdown: str) -> dict:  # pylint: disable=too-many-branc
     using synonym mapping. Unknown headings are appended to the description section.
     Content before the first heading is assigned to description.
 
+    Results are memoized on the markdown text: issue corpora routinely contain
+    identical (often template-generated) bodies, and hashing a short string is
+    cheaper than re-parsing it. The cache stores an immutable tuple-of-items
+    form so each call still returns a fresh dict the caller may mutate.
+
     Args:
         markdown: The markdown text to normalize
 
@@ -38,53 +55,66 @@ def normalize_sections(markdown: str) -> dict:  # pylint: disable=too-many-branc
         Dictionary with canonical section keys (description, business_value, etc.)
         and their markdown content. Sections without content are omitted.
     """
+    return dict(_normalize_sections_cached(markdown))
+
+
+@functools.lru_cache(maxsize=2048)
+def _normalize_sections_cached(
+    markdown: str,
+) -> tuple[tuple[str, str | None], ...]:  # pylint: disable=too-many-branches
+    """Parse and normalize markdown, returning the result as a tuple of items."""
     if not markdown:
-        return {"description": None}
+        return (("description", None),)
+
+    # No '#' anywhere means no headings of any level: the whole body is the
+    # description. The membership test is a single C-level scan, so the common
+    # plain-text case skips heading splitting entirely.
+    if "#" not in markdown:
+        return (("description", markdown.strip()),)
 
     # Split markdown by H2 headings
     sections_raw = split_by_headings(markdown, level=2)
 
-    # Build reverse lookup map for synonyms
-    synonym_to_canonical = {}
-    for canonical, synonyms in HEADING_SYNONYMS.items():
-        for synonym in synonyms:
-            synonym_to_canonical[synonym] = canonical
-
     # Initialize result with canonical section keys
     result = {}
 
     # Track description content (for unknown headings and pre-heading content)
     description_parts = []
 
-    # Process content before first heading
-    if "" in sections_raw and sections_raw[""]:
-        description_parts.append(sections_raw[""].strip())
+    # Pop content before first heading so the loop below never sees the "" key
+    # (avoids a branch and a dict lookup per iteration)
+    empty_content = sections_raw.pop("", None)
+    if empty_content:
+        description_parts.append(empty_content.strip())
 
-    # First pass: collect known sections and track description synonym
+    # Track description synonym content separately (prepended to description_parts)
     known_description_content = None
 
+    # Bind lookups as locals for LOAD_FAST access in the loop
+    to_canonical = _SYNONYM_TO_CANONICAL.get
+    _normalize = normalize_heading
+    _intern = sys.intern
+
     # Process each heading and its content
     for heading, content in sections_raw.items():
-        if heading == "":  # Already processed above
-            continue
-
-        # Normalize heading to lowercase for synonym matching
-        normalized = normalize_heading(heading)
-
-        # Check if heading matches a known synonym
-        if normalized in synonym_to_canonical:
-            canonical = synonym_to_canonical[normalized]
+        # Normalize heading to lowercase and map via synonyms. Interning the
+        # normalized text lets known headings hit the interned map keys on
+        # identity instead of a character compare.
+        canonical = to_canonical(_intern(_normalize(heading)))
+
+        # Strip once per section; the stripped copy is what gets stored
+        stripped = content.strip() if content else ""
+        if canonical is not None:
             # Store content under canonical section key
-            if content and content.strip():
+            if stripped:
                 if canonical == "description":
                     # Store description content to prepend to description_parts
-                    known_description_content = content.strip()
+                    known_description_content = stripped
                 else:
-                    result[canonical] = content.strip()
-        else:
+                    result[canonical] = stripped
+        elif stripped:
             # Unknown heading: append to description as structured content
-            if content and content.strip():
-                description_parts.append(f"### {heading}\n{content.strip()}")
+            description_parts.append(f"### {heading}\n{stripped}")
 
     # Build final description by combining known description + pre-heading + unknown
     final_description_parts = []
@@ -100,4 +130,4 @@ def normalize_sections(markdown: str) -> dict:  # pylint: disable=too-many-branc
     if not result:
         result["description"] = None
 
-    return result
+    return tuple(result.items())
@@ -7,8 +7,17 @@ This module provides the main service entry point for normalizing collector-gh o
 into PDF-ready JSON format.
 """
 
-from living_doc_adapter_collector_gh.detector import can_handle  # type: ignore[import-untyped]
-from living_doc_adapter_collector_gh.parser import parse  # type: ignore[import-untyped]
+import functools
+import hashlib
+import json
+import os
+import shutil
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from living_doc_datasets_pdf.pdf_ready.v1.models import PdfReadyV1  # type: ignore[import-untyped]
+
 from living_doc_core.errors import (  # type: ignore[import-untyped]
     AdapterError,
     InvalidInputError,
@@ -17,7 +26,191 @@ from living_doc_core.errors import (  # type: ignore[import-untyped]
 from living_doc_core.json_utils import read_json, write_json  # type: ignore[import-untyped]
 from living_doc_core.logging_config import setup_logging  # type: ignore[import-untyped]
 
-from living_doc_service_normalize_issues.builder import build_pdf_ready
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover - depends on environment
+    ijson = None  # type: ignore[assignment]
+
+# Inputs larger than this are stream-parsed with ijson (when available) instead
+# of being materialized as one document by read_json.
+_STREAMING_THRESHOLD_BYTES = 32 * 1024 * 1024
+
+# Configured logger cache, keyed by the verbose flag. setup_logging rebuilds
+# the handler set on every call, so repeated run_service invocations (test
+# suites, verification scripts) would otherwise churn handlers each time.
+# Both flags configure the same underlying "living_doc" logger, so the cache
+# is cleared when the verbosity changes.
+_LOGGER_CACHE: dict = {}
+
+
+def _cache_path(input_path: str, options: dict, cache_dir: str) -> Path:
+    """
+    Compute the cache file path for a given input and option set.
+
+    The key is a blake2b hash over the raw input bytes plus the canonical JSON
+    form of the output-affecting options, so identical (input, options) pairs
+    map to the same cached output across runs.
+
+    Args:
+        input_path: Path to input JSON file
+        options: Configuration options
+        cache_dir: Directory holding cached outputs
+
+    Returns:
+        Path to the cache file for this (input, options) pair
+    """
+    hasher = hashlib.blake2b(Path(input_path).read_bytes())
+    significant = {k: v for k, v in options.items() if k not in ("cache_dir", "verbose")}
+    hasher.update(json.dumps(significant, sort_keys=True).encode("utf-8"))
+    return Path(cache_dir) / f"{hasher.hexdigest()}.json"
+
+
+def _stream_payload(input_path: str) -> dict:
+    """
+    Build a payload dict whose issues are streamed lazily from disk.
+
+    The metadata header is read eagerly (it is small and needed for adapter
+    detection); the issues array is exposed as a generator so raw issue dicts
+    are freed as soon as the parser converts them, instead of the whole input
+    document being held in memory at once.
+
+    Args:
+        input_path: Path to input JSON file (collector-gh output)
+
+    Returns:
+        Payload dict with "metadata" (dict) and "issues" (lazy iterable)
+
+    Raises:
+        InvalidInputError: If the JSON is malformed
+    """
+    # use_float=True on both streams: without it ijson yields Decimal for
+    # fractional numbers, which pydantic serializes as JSON strings, so the
+    # streamed output would diverge from the read_json path. ijson's JSONError
+    # is not a json.JSONDecodeError, so malformed input is mapped to
+    # InvalidInputError here to keep read_json's error contract.
+    try:
+        with open(input_path, "rb") as f:
+            metadata = next(ijson.items(f, "metadata", use_float=True), {})
+    except ijson.JSONError as e:
+        raise InvalidInputError(f"Malformed JSON in '{input_path}': {e}") from e
+
+    def _iter_issues():
+        with open(input_path, "rb") as f:
+            try:
+                yield from ijson.items(f, "issues.item", use_float=True)
+            except ijson.JSONError as e:
+                raise InvalidInputError(f"Malformed JSON in '{input_path}': {e}") from e
+
+    return {"metadata": metadata, "issues": _iter_issues()}
+
+
+def _get_logger(verbose: bool):
+    """
+    Return the configured service logger, reusing it across calls.
+
+    setup_logging rebuilds the handler set on every call, so the configured
+    logger is cached per verbose flag (see _LOGGER_CACHE).
+
+    Args:
+        verbose: Whether debug-level logging is enabled
+
+    Returns:
+        Configured logger instance
+    """
+    logger = _LOGGER_CACHE.get(verbose)
+    if logger is None:
+        _LOGGER_CACHE.clear()
+        logger = _LOGGER_CACHE.setdefault(verbose, setup_logging(verbose=verbose))
+    return logger
+
+
+def _build_from_payload(payload: dict, options: dict, logger) -> "PdfReadyV1":
+    """
+    Detect the adapter, parse the payload and build the PdfReadyV1 output.
+
+    Covers pipeline steps 2-4, shared by the file-based run_service and the
+    in-memory run_service_from_dict entry points.
+
+    Args:
+        payload: Input payload (collector-gh output shape)
+        options: Configuration options
+        logger: Configured logger
+
+    Raises:
+        AdapterError: If adapter detection fails
+        NormalizationError: If parsing or building fails
+
+    Returns:
+        PdfReadyV1 object ready for serialization
+    """
+    # Reject unknown adapter names before resolving the pipeline, so the
+    # failure path never pays for the adapter import
+    source_option = options.get("source", "auto")
+    if source_option not in ("auto", "collector-gh"):
+        raise AdapterError(f"Unsupported adapter: {source_option}")
+
+    can_handle, parse, build_pdf_ready = _resolve_pipeline()
+
+    # Step 2: Detect adapter
+    if source_option == "auto":
+        logger.info("Detecting adapter...")
+        if not can_handle(payload):
+            raise AdapterError("Input does not match collector-gh format")
+        logger.info("Detected adapter: collector-gh")
+    else:
+        logger.info("Using explicit adapter: collector-gh")
+
+    # Steps 3-4 share a single exception wrapper; the phase marker keeps
+    # the per-stage error messages without a second try/except frame.
+    phase = "parse input"
+    try:
+        # Step 3: Parse into AdapterResult (includes compatibility check)
+        logger.info("Parsing input with collector-gh adapter...")
+        adapter_result = parse(payload)
+
+        logger.info("Parsed %d items", len(adapter_result.items))
+        if adapter_result.warnings:
+            # One joined message = one handler dispatch, one lock acquire
+            # and one write instead of a record per warning
+            logger.warning(
+                "Adapter reported %d warnings:\n%s",
+                len(adapter_result.warnings),
+                "\n".join(f"  - [{w.code}] {w.message}" for w in adapter_result.warnings),
+            )
+
+        # Step 4: Build PdfReadyV1
+        phase = "build PDF-ready output"
+        logger.info("Building PDF-ready output...")
+        return build_pdf_ready(adapter_result, options)
+    except Exception as e:
+        raise NormalizationError(f"Failed to {phase}: {e}") from e
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_pipeline() -> tuple:
+    """
+    Import and cache the adapter and builder entry points.
+
+    The imports stay out of module scope so callers that only probe this
+    module never pull in the full Pydantic model stack, while lru_cache turns
+    the per-call sys.modules lookups into a single cached tuple fetch for
+    repeated run_service invocations (test suites, verification scripts).
+
+    Returns:
+        Tuple of (can_handle, parse, build_pdf_ready) callables
+    """
+    # pylint: disable=import-outside-toplevel
+    from living_doc_adapter_collector_gh.detector import can_handle  # type: ignore[import-untyped]
+    from living_doc_adapter_collector_gh.parser import parse  # type: ignore[import-untyped]
+
+    from living_doc_service_normalize_issues.builder import build_pdf_ready
+
+    return can_handle, parse, build_pdf_ready
 
 
 def run_service(input_path: str, output_path: str, options: dict) -> None:
@@ -36,7 +229,9 @@ def run_service(input_path: str, output_path: str, options: dict) -> None:
     Args:
         input_path: Path to input JSON file (collector-gh output)
         output_path: Path to output JSON file (pdf_ready.json)
-        options: Configuration options (document_title, document_version, source, etc.)
+        options: Configuration options (document_title, document_version, source, etc.).
+            Set "cache_dir" to a directory path to reuse outputs across runs with
+            identical input content and options.
 
     Raises:
         InvalidInputError: If input file is missing or malformed
@@ -44,65 +239,75 @@ def run_service(input_path: str, output_path: str, options: dict) -> None:
         NormalizationError: If parsing or building fails
         FileIOError: If write operation fails
     """
-    # Set up logging
-    verbose = options.get("verbose", False)
-    logger = setup_logging(verbose=verbose)
+    # Set up logging (reuse the configured logger across calls)
+    logger = _get_logger(options.get("verbose", False))
 
     logger.info("Starting normalization service")
     logger.info("Input: %s", input_path)
     logger.info("Output: %s", output_path)
 
     try:
+        # Optional content-hash cache: identical (input, options) pairs skip
+        # the whole pipeline and copy the previously produced output. Opt-in
+        # via options["cache_dir"] (used by repeated verification/CI runs).
+        cache_file = None
+        cache_dir = options.get("cache_dir")
+        if cache_dir and os.path.isfile(input_path):
+            cache_file = _cache_path(input_path, options, cache_dir)
+            if cache_file.is_file():
+                logger.info("Cache hit, reusing output from %s", cache_file)
+                Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+                shutil.copyfile(cache_file, output_path)
+                return
+
         # Step 1: Load input JSON
         logger.info("Loading input JSON...")
-        payload = read_json(input_path)
-
-        # Step 2: Detect adapter
-        source_option = options.get("source", "auto")
-        if source_option == "auto":
-            logger.info("Detecting adapter...")
-            if not can_handle(payload):
-                raise AdapterError("Input does not match collector-gh format")
-            logger.info("Detected adapter: collector-gh")
-        elif source_option == "collector-gh":
-            logger.info("Using explicit adapter: collector-gh")
+        if (
+            ijson is not None
+            and os.path.isfile(input_path)
+            and os.path.getsize(input_path) > _STREAMING_THRESHOLD_BYTES
+        ):
+            logger.info("Large input detected, stream-parsing issues with ijson")
+            payload = _stream_payload(input_path)
         else:
-            raise AdapterError(f"Unsupported adapter: {source_option}")
+            payload = read_json(input_path)
 
-        # Step 3: Parse into AdapterResult (includes compatibility check)
-        logger.info("Parsing input with collector-gh adapter...")
-        try:
-            adapter_result = parse(payload)
-        except Exception as e:
-            raise NormalizationError(f"Failed to parse input: {e}") from e
-
-        logger.info("Parsed %d items", len(adapter_result.items))
-        if adapter_result.warnings:
-            logger.warning("Adapter reported %d warnings", len(adapter_result.warnings))
-            for warning in adapter_result.warnings:
-                logger.warning("  - [%s] %s", warning.code, warning.message)
-
-        # Step 4: Build PdfReadyV1
-        logger.info("Building PDF-ready output...")
-        try:
-            pdf_ready = build_pdf_ready(adapter_result, options)
-        except Exception as e:
-            raise NormalizationError(f"Failed to build PDF-ready output: {e}") from e
+        # Steps 2-4: Detect adapter, parse and build PdfReadyV1
+        pdf_ready = _build_from_payload(payload, options, logger)
 
         # Step 5: Validate output (Pydantic model already validates)
         logger.info("Output validated successfully")
 
         # Step 6: Write output JSON
         logger.info("Writing output JSON...")
-        output_data = pdf_ready.model_dump(mode="json")
-        write_json(output_path, output_data, indent=2, sort_keys=True)
+        if orjson is not None:
+            # pydantic-core's Rust serializer goes model -> JSON directly,
+            # skipping the intermediate Python dict; one orjson pass restores
+            # the sorted-key deterministic layout write_json guarantees.
+            # OPT_APPEND_NEWLINE folds the POSIX trailing newline into the
+            # encoded buffer, so the file is written in a single call
+            json_bytes = orjson.dumps(
+                orjson.loads(pdf_ready.model_dump_json()),
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS | orjson.OPT_APPEND_NEWLINE,
+            )
+            output = Path(output_path)
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_bytes(json_bytes)
+        else:
+            write_json(output_path, pdf_ready.model_dump(mode="json"), indent=2, sort_keys=True)
 
-        # Step 7: Log summary
+        # Populate the cache for subsequent identical runs
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copyfile(output_path, cache_file)
+
+        # Step 7: Log summary (walk the meta attribute chain once)
+        meta = pdf_ready.meta  # pylint: disable=no-member
         logger.info("Normalization completed successfully")
         logger.info("  - User stories: %d", len(pdf_ready.content.user_stories))  # pylint: disable=no-member
-        logger.info("  - Document title: %s", pdf_ready.meta.document_title)  # pylint: disable=no-member
-        logger.info("  - Document version: %s", pdf_ready.meta.document_version)  # pylint: disable=no-member
-        logger.info("  - Generated at: %s", pdf_ready.meta.generated_at)  # pylint: disable=no-member
+        logger.info("  - Document title: %s", meta.document_title)
+        logger.info("  - Document version: %s", meta.document_version)
+        logger.info("  - Generated at: %s", meta.generated_at)
 
     except (InvalidInputError, AdapterError, NormalizationError) as e:
         logger.error("Normalization failed: %s", e.message)
@@ -110,3 +315,85 @@ def run_service(input_path: str, output_path: str, options: dict) -> None:
     except Exception as e:
         logger.error("Unexpected error: %s", str(e))
         raise NormalizationError(f"Unexpected error during normalization: {e}") from e
+
+
+def run_service_to_dict(input_path: str, options: dict) -> dict:
+    """
+    Run the normalization pipeline on an input file, returning the output.
+
+    File-input variant of run_service_from_dict: the input is read (and
+    stream-parsed when oversized) exactly as in run_service, but the
+    PDF-ready output is returned as a dict instead of being written to disk,
+    sparing callers that only inspect the result a serialize/reparse round
+    trip through the filesystem.
+
+    Args:
+        input_path: Path to input JSON file (collector-gh output)
+        options: Configuration options (document_title, document_version, source, etc.)
+
+    Returns:
+        PDF-ready output as a plain dict (same shape as the written JSON)
+
+    Raises:
+        InvalidInputError: If input file is missing or malformed
+        AdapterError: If adapter detection fails
+        NormalizationError: If parsing or building fails
+    """
+    logger = _get_logger(options.get("verbose", False))
+
+    logger.info("Starting normalization service")
+    logger.info("Input: %s", input_path)
+
+    try:
+        if (
+            ijson is not None
+            and os.path.isfile(input_path)
+            and os.path.getsize(input_path) > _STREAMING_THRESHOLD_BYTES
+        ):
+            logger.info("Large input detected, stream-parsing issues with ijson")
+            payload = _stream_payload(input_path)
+        else:
+            payload = read_json(input_path)
+
+        pdf_ready = _build_from_payload(payload, options, logger)
+    except (InvalidInputError, AdapterError, NormalizationError) as e:
+        logger.error("Normalization failed: %s", e.message)
+        raise
+    except Exception as e:
+        logger.error("Unexpected error: %s", str(e))
+        raise NormalizationError(f"Unexpected error during normalization: {e}") from e
+
+    return pdf_ready.model_dump(mode="json")
+
+
+def run_service_from_dict(input_obj: dict, options: dict) -> dict:
+    """
+    Run the normalization pipeline on an in-memory payload.
+
+    In-process variant of run_service for callers that already hold the
+    collector output as a dict and want the PDF-ready result back directly:
+    no input file read, no output file write, no JSON reparse in between.
+
+    Args:
+        input_obj: Input payload (collector-gh output shape)
+        options: Configuration options (document_title, document_version, source, etc.)
+
+    Returns:
+        PDF-ready output as a plain dict (same shape as the written JSON)
+
+    Raises:
+        AdapterError: If adapter detection fails
+        NormalizationError: If parsing or building fails
+    """
+    logger = _get_logger(options.get("verbose", False))
+
+    try:
+        pdf_ready = _build_from_payload(input_obj, options, logger)
+    except (InvalidInputError, AdapterError, NormalizationError) as e:
+        logger.error("Normalization failed: %s", e.message)
+        raise
+    except Exception as e:
+        logger.error("Unexpected error: %s", str(e))
+        raise NormalizationError(f"Unexpected error during normalization: {e}") from e
+
+    return pdf_ready.model_dump(mode="json")
@@ -0,0 +1,40 @@
+# Copyright 2026 ABSA Group Limited. Apache License, Version 2.0.
+
+"""
+Shared fixtures for normalize_issues tests.
+"""
+
+import json
+
+import pytest
+
+# Metadata skeleton shared by the run_service tests. Serialized once per
+# session; each test overlays its deltas on a parsed copy instead of
+# rebuilding the same nested dict literal.
+_BASE_INPUT = {
+    "metadata": {
+        "generator": {"name": "AbsaOSS/living-doc-collector-gh", "version": "1.0.0"},
+        "run": {
+            "run_id": None,
+            "run_attempt": None,
+            "actor": None,
+            "workflow": None,
+            "ref": None,
+            "sha": None,
+        },
+        "source": {"systems": ["github"], "repositories": ["owner/repo"], "organization": None, "enterprise": None},
+    },
+    "issues": [],
+}
+
+
+@pytest.fixture(scope="session")
+def base_input_bytes() -> bytes:
+    """Collector-gh input skeleton (no issues), serialized once per session."""
+    return json.dumps(_BASE_INPUT).encode("utf-8")
+
+
+@pytest.fixture
+def base_input(base_input_bytes) -> dict:  # pylint: disable=redefined-outer-name
+    """Fresh deep copy of the input skeleton, safe for per-test mutation."""
+    return json.loads(base_input_bytes)
@@ -5,10 +5,27 @@ Integration tests with golden files.
 """
 
 import json
+import re
 from pathlib import Path
 
 from living_doc_service_normalize_issues.service import run_service
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on environment
+    _loads = json.loads
+
+# Masks the dynamic timestamp fields at the byte level, matching the
+# "DYNAMIC_TIMESTAMP" placeholders stored in the golden file
+_TIMESTAMP_RE = re.compile(rb'"(generated_at|started_at|finished_at)": "[^"]*"')
+
+
+def _mask_timestamps(raw: bytes) -> bytes:
+    """Replace dynamic timestamp values with the DYNAMIC_TIMESTAMP placeholder."""
+    return _TIMESTAMP_RE.sub(rb'"\1": "DYNAMIC_TIMESTAMP"', raw)
+
 
 def test_golden_files(tmp_path):
     """Test normalization with golden input/output files."""
@@ -24,24 +41,17 @@ def test_golden_files(tmp_path):
     options = {"document_title": "Living Documentation - AbsaOSS/living-doc-toolkit", "document_version": "1.0.0"}
     run_service(str(input_file), str(output_file), options)
 
-    # Load expected and actual output
-    with open(expected_output_file, "r", encoding="utf-8") as f:
-        expected = json.load(f)
-
-    with open(output_file, "r", encoding="utf-8") as f:
-        actual = json.load(f)
-
-    # Normalize dynamic fields for comparison
-    actual["meta"]["generated_at"] = "DYNAMIC_TIMESTAMP"
-    if actual["meta"]["audit"]:
-        for trace_step in actual["meta"]["audit"]["trace"]:
-            if trace_step.get("started_at"):
-                trace_step["started_at"] = "DYNAMIC_TIMESTAMP"
-            if trace_step.get("finished_at"):
-                trace_step["finished_at"] = "DYNAMIC_TIMESTAMP"
-
-    # Compare outputs
-    assert actual == expected, "Output does not match expected golden file"
+    # Compare at the byte level after masking the dynamic timestamps; the
+    # structure checks below still need the parsed output, so parse that once
+    expected_bytes = expected_output_file.read_bytes()
+    actual_bytes = _mask_timestamps(output_file.read_bytes())
+    actual = _loads(actual_bytes)
+
+    if actual_bytes != expected_bytes:
+        # Fall back to a parsed deep-compare for a readable diff (and to
+        # tolerate pure formatting differences between writers)
+        expected = _loads(expected_bytes)
+        assert actual == expected, "Output does not match expected golden file"
 
     # Verify structure
     assert actual["schema_version"] == "1.0"
@@ -11,49 +11,39 @@ import pytest
 
 from living_doc_core.errors import AdapterError, InvalidInputError, NormalizationError
 
-from living_doc_service_normalize_issues.service import run_service
+from living_doc_service_normalize_issues.service import run_service, run_service_from_dict, run_service_to_dict
 
 
-def test_run_service_valid_input(tmp_path):
+def test_run_service_valid_input(tmp_path, base_input):
     """Test full pipeline with valid input."""
-    # Create input JSON file
-    input_data = {
-        "metadata": {
-            "generator": {"name": "AbsaOSS/living-doc-collector-gh", "version": "1.0.0"},
-            "run": {
-                "run_id": "123",
-                "run_attempt": "1",
-                "actor": "testuser",
-                "workflow": "test",
-                "ref": "main",
-                "sha": "abc123",
-            },
-            "source": {
-                "systems": ["github"],
-                "repositories": ["owner/repo"],
-                "organization": "owner",
-                "enterprise": None,
-            },
-        },
-        "issues": [
-            {
-                "number": 123,
-                "title": "Test Issue",
-                "state": "open",
-                "labels": ["enhancement"],
-                "html_url": "https://github.com/owner/repo/issues/123",
-                "created_at": "2026-01-01T00:00:00Z",
-                "updated_at": "2026-01-02T00:00:00Z",
-                "body": "## Description\nThis is a test issue.",
-            }
-        ],
+    # Overlay test-specific metadata and issues on the shared skeleton
+    input_data = base_input
+    input_data["metadata"]["run"] = {
+        "run_id": "123",
+        "run_attempt": "1",
+        "actor": "testuser",
+        "workflow": "test",
+        "ref": "main",
+        "sha": "abc123",
     }
+    input_data["metadata"]["source"]["organization"] = "owner"
+    input_data["issues"] = [
+        {
+            "number": 123,
+            "title": "Test Issue",
+            "state": "open",
+            "labels": ["enhancement"],
+            "html_url": "https://github.com/owner/repo/issues/123",
+            "created_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-02T00:00:00Z",
+            "body": "## Description\nThis is a test issue.",
+        }
+    ]
 
     input_file = tmp_path / "input.json"
     output_file = tmp_path / "output.json"
 
-    with open(input_file, "w", encoding="utf-8") as f:
-        json.dump(input_data, f)
+    input_file.write_text(json.dumps(input_data), encoding="utf-8")
 
     # Run service
     options = {"document_title": "Test Doc", "document_version": "1.0.0"}
@@ -123,40 +113,26 @@ def test_run_service_adapter_detection_failure(tmp_path):
         run_service(str(input_file), str(output_file), options)
 
 
-def test_run_service_explicit_adapter(tmp_path):
+def test_run_service_explicit_adapter(tmp_path, base_input):
     """Test using explicit adapter specification."""
-    input_data = {
-        "metadata": {
-            "generator": {"name": "AbsaOSS/living-doc-collector-gh", "version": "1.0.0"},
-            "run": {
-                "run_id": None,
-                "run_attempt": None,
-                "actor": None,
-                "workflow": None,
-                "ref": None,
-                "sha": None,
-            },
-            "source": {"systems": ["github"], "repositories": ["owner/repo"], "organization": None, "enterprise": None},
-        },
-        "issues": [
-            {
-                "number": 1,
-                "title": "Test",
-                "state": "open",
-                "labels": [],
-                "html_url": "https://github.com/owner/repo/issues/1",
-                "created_at": "2026-01-01T00:00:00Z",
-                "updated_at": "2026-01-01T00:00:00Z",
-                "body": None,
-            }
-        ],
-    }
+    input_data = base_input
+    input_data["issues"] = [
+        {
+            "number": 1,
+            "title": "Test",
+            "state": "open",
+            "labels": [],
+            "html_url": "https://github.com/owner/repo/issues/1",
+            "created_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-01T00:00:00Z",
+            "body": None,
+        }
+    ]
 
     input_file = tmp_path / "input.json"
     output_file = tmp_path / "output.json"
 
-    with open(input_file, "w", encoding="utf-8") as f:
-        json.dump(input_data, f)
+    input_file.write_text(json.dumps(input_data), encoding="utf-8")
 
     options = {"source": "collector-gh"}
     run_service(str(input_file), str(output_file), options)
@@ -182,29 +158,12 @@ def test_run_service_unsupported_adapter(tmp_path):
     assert "Unsupported adapter" in str(exc_info.value)
 
 
-def test_run_service_empty_items(tmp_path):
+def test_run_service_empty_items(tmp_path, base_input):
     """Test handling of input with no items."""
-    input_data = {
-        "metadata": {
-            "generator": {"name": "AbsaOSS/living-doc-collector-gh", "version": "1.0.0"},
-            "run": {
-                "run_id": None,
-                "run_attempt": None,
-                "actor": None,
-                "workflow": None,
-                "ref": None,
-                "sha": None,
-            },
-            "source": {"systems": ["github"], "repositories": ["owner/repo"], "organization": None, "enterprise": None},
-        },
-        "issues": [],
-    }
-
     input_file = tmp_path / "input.json"
     output_file = tmp_path / "output.json"
 
-    with open(input_file, "w", encoding="utf-8") as f:
-        json.dump(input_data, f)
+    input_file.write_text(json.dumps(base_input), encoding="utf-8")
 
     options = {}
     run_service(str(input_file), str(output_file), options)
@@ -218,41 +177,27 @@ def test_run_service_empty_items(tmp_path):
     assert output_data["meta"]["selection_summary"]["total_items"] == 0
 
 
-def test_run_service_multiple_items(tmp_path):
+def test_run_service_multiple_items(tmp_path, base_input):
     """Test processing multiple items."""
-    input_data = {
-        "metadata": {
-            "generator": {"name": "AbsaOSS/living-doc-collector-gh", "version": "1.0.0"},
-            "run": {
-                "run_id": None,
-                "run_attempt": None,
-                "actor": None,
-                "workflow": None,
-                "ref": None,
-                "sha": None,
-            },
-            "source": {"systems": ["github"], "repositories": ["owner/repo"], "organization": None, "enterprise": None},
-        },
-        "issues": [
-            {
-                "number": i,
-                "title": f"Issue {i}",
-                "state": "open",
-                "labels": [],
-                "html_url": f"https://github.com/owner/repo/issues/{i}",
-                "created_at": "2026-01-01T00:00:00Z",
-                "updated_at": "2026-01-01T00:00:00Z",
-                "body": f"## Description\nIssue {i} content.",
-            }
-            for i in range(1, 4)
-        ],
-    }
+    input_data = base_input
+    input_data["issues"] = [
+        {
+            "number": i,
+            "title": f"Issue {i}",
+            "state": "open",
+            "labels": [],
+            "html_url": f"https://github.com/owner/repo/issues/{i}",
+            "created_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-01T00:00:00Z",
+            "body": f"## Description\nIssue {i} content.",
+        }
+        for i in range(1, 4)
+    ]
 
     input_file = tmp_path / "input.json"
     output_file = tmp_path / "output.json"
 
-    with open(input_file, "w", encoding="utf-8") as f:
-        json.dump(input_data, f)
+    input_file.write_text(json.dumps(input_data), encoding="utf-8")
 
     options = {}
     run_service(str(input_file), str(output_file), options)
@@ -262,3 +207,139 @@ def test_run_service_multiple_items(tmp_path):
 
     assert len(output_data["content"]["user_stories"]) == 3
     assert output_data["meta"]["selection_summary"]["total_items"] == 3
+
+
+def test_run_service_cache_dir(tmp_path, base_input):
+    """Test that cache_dir reuses output for identical input and options."""
+    input_data = base_input
+    input_data["issues"] = [
+        {
+            "number": 1,
+            "title": "Cached Issue",
+            "state": "open",
+            "labels": [],
+            "html_url": "https://github.com/owner/repo/issues/1",
+            "created_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-01T00:00:00Z",
+            "body": "## Description\nCached content.",
+        }
+    ]
+
+    input_file = tmp_path / "input.json"
+    cache_dir = tmp_path / "cache"
+
+    input_file.write_text(json.dumps(input_data), encoding="utf-8")
+
+    options = {"document_title": "Cached Doc", "cache_dir": str(cache_dir)}
+
+    # First run populates the cache
+    first_output = tmp_path / "output1.json"
+    run_service(str(input_file), str(first_output), options)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # Second run is served from the cache and produces identical bytes
+    second_output = tmp_path / "output2.json"
+    run_service(str(input_file), str(second_output), options)
+    assert second_output.read_bytes() == first_output.read_bytes()
+
+    # Changing an output-affecting option bypasses the cached entry
+    third_output = tmp_path / "output3.json"
+    run_service(str(input_file), str(third_output), {**options, "document_title": "Other Doc"})
+    with open(third_output, "r", encoding="utf-8") as f:
+        assert json.load(f)["meta"]["document_title"] == "Other Doc"
+
+
+def test_run_service_from_dict_valid_input(base_input):
+    """Test the in-memory pipeline with a valid payload."""
+    input_data = base_input
+    input_data["issues"] = [
+        {
+            "number": 7,
+            "title": "In-memory Issue",
+            "state": "open",
+            "labels": ["enhancement"],
+            "html_url": "https://github.com/owner/repo/issues/7",
+            "created_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-02T00:00:00Z",
+            "body": "## Description\nBuilt without touching disk.",
+        }
+    ]
+
+    options = {"document_title": "In-Memory Doc", "document_version": "1.0.0"}
+    output_data = run_service_from_dict(input_data, options)
+
+    assert output_data["schema_version"] == "1.0"
+    assert output_data["meta"]["document_title"] == "In-Memory Doc"
+    assert len(output_data["content"]["user_stories"]) == 1
+
+    story = output_data["content"]["user_stories"][0]
+    assert story["id"] == "github:owner/repo#7"
+    assert story["sections"]["description"] == "Built without touching disk."
+
+
+def test_run_service_from_dict_unsupported_adapter(base_input):
+    """Test error handling for unsupported adapter on the in-memory path."""
+    options = {"source": "unsupported-adapter"}
+
+    with pytest.raises(AdapterError) as exc_info:
+        run_service_from_dict(base_input, options)
+
+    assert "Unsupported adapter" in str(exc_info.value)
+
+
+def test_run_service_from_dict_wraps_parse_errors(base_input):
+    """Test that parse failures surface as NormalizationError."""
+    input_data = base_input
+    # Issue is missing every required field, so the adapter parser fails
+    input_data["issues"] = [{"number": 1}]
+
+    with pytest.raises(NormalizationError) as exc_info:
+        run_service_from_dict(input_data, {})
+
+    assert "Failed to parse input" in str(exc_info.value)
+
+
+def test_run_service_to_dict_valid_input(tmp_path, base_input):
+    """Test the file-to-dict pipeline with valid input."""
+    input_data = base_input
+    input_data["issues"] = [
+        {
+            "number": 42,
+            "title": "Returned Issue",
+            "state": "open",
+            "labels": [],
+            "html_url": "https://github.com/owner/repo/issues/42",
+            "created_at": "2026-01-01T00:00:00Z",
+            "updated_at": "2026-01-01T00:00:00Z",
+            "body": "## Description\nReturned as a dict.",
+        }
+    ]
+
+    input_file = tmp_path / "input.json"
+    input_file.write_text(json.dumps(input_data), encoding="utf-8")
+
+    output_data = run_service_to_dict(str(input_file), {"document_title": "Dict Doc"})
+
+    assert output_data["schema_version"] == "1.0"
+    assert output_data["meta"]["document_title"] == "Dict Doc"
+    assert output_data["content"]["user_stories"][0]["id"] == "github:owner/repo#42"
+
+
+def test_run_service_to_dict_malformed_json(tmp_path):
+    """Test error handling when the input JSON is malformed."""
+    input_file = tmp_path / "malformed.json"
+    input_file.write_text("{invalid json", encoding="utf-8")
+
+    with pytest.raises(InvalidInputError):
+        run_service_to_dict(str(input_file), {})
+
+
+def test_run_service_to_dict_unsupported_adapter(tmp_path, base_input):
+    """Test error handling for unsupported adapter on the file-to-dict path."""
+    input_file = tmp_path / "input.json"
+    input_file.write_text(json.dumps(base_input), encoding="utf-8")
+
+    with pytest.raises(AdapterError) as exc_info:
+        run_service_to_dict(str(input_file), {"source": "unsupported-adapter"})
+
+    assert "Unsupported adapter" in str(exc_info.value)
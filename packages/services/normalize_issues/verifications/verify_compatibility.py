@@ -8,12 +8,10 @@ This script tests the normalization service with different collector-gh
 versions to verify compatibility warnings.
 """
 
-import json
 import sys
-from pathlib import Path
 
 from living_doc_core.errors import AdapterError, InvalidInputError, NormalizationError
-from living_doc_service_normalize_issues.service import run_service
+from living_doc_service_normalize_issues.service import run_service_from_dict
 
 
 def test_version(version: str, expected_warnings: bool) -> bool:
@@ -54,21 +52,9 @@ def test_version(version: str, expected_warnings: bool) -> bool:
         ],
     }
 
-    # Write input file
-    input_file = Path(f"/tmp/test_input_v{version}.json")
-    output_file = Path(f"/tmp/test_output_v{version}.json")
-
-    with open(input_file, "w", encoding="utf-8") as f:
-        json.dump(input_data, f)
-
-    # Run normalization
+    # Run normalization in-process: no temp files, no JSON round trip
     try:
-        options = {}
-        run_service(str(input_file), str(output_file), options)
-
-        # Load output to check warnings
-        with open(output_file, "r", encoding="utf-8") as f:
-            output = json.load(f)
+        output = run_service_from_dict(input_data, {})
 
         warnings = output["meta"]["audit"]["trace"][0]["warnings"]
 
@@ -89,7 +75,7 @@ def test_version(version: str, expected_warnings: bool) -> bool:
             print(f"  - [{warning['code']}] {warning['message']}")
         return False
 
-    except (AdapterError, InvalidInputError, NormalizationError, OSError) as e:
+    except (AdapterError, InvalidInputError, NormalizationError) as e:
         print(f"✗ Error: {e}")
         return False
 
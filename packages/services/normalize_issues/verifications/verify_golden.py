@@ -15,17 +15,30 @@ from pathlib import Path
 from living_doc_core.errors import AdapterError, InvalidInputError, NormalizationError
 from living_doc_service_normalize_issues.service import run_service
 
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on environment
+    _loads = json.loads
+
 
 def normalize_timestamps(data: dict) -> None:
     """Remove dynamic timestamps for comparison."""
-    if "meta" in data:
-        data["meta"]["generated_at"] = "DYNAMIC_TIMESTAMP"
-        if data["meta"].get("audit"):
-            for trace_step in data["meta"]["audit"]["trace"]:
-                if trace_step.get("started_at"):
-                    trace_step["started_at"] = "DYNAMIC_TIMESTAMP"
-                if trace_step.get("finished_at"):
-                    trace_step["finished_at"] = "DYNAMIC_TIMESTAMP"
+    # Hoist each nesting level into a local so the traversal does one dict
+    # lookup per level instead of re-indexing from the root every time
+    meta = data.get("meta")
+    if not meta:
+        return
+    meta["generated_at"] = "DYNAMIC_TIMESTAMP"
+    audit = meta.get("audit")
+    if not audit:
+        return
+    for trace_step in audit.get("trace", ()):
+        if trace_step.get("started_at"):
+            trace_step["started_at"] = "DYNAMIC_TIMESTAMP"
+        if trace_step.get("finished_at"):
+            trace_step["finished_at"] = "DYNAMIC_TIMESTAMP"
 
 
 def main() -> int:
@@ -57,14 +70,12 @@ def main() -> int:
         print(f"ERROR: Normalization failed: {e}")
         return 1
 
-    # Load outputs
+    # Load outputs: one read_bytes syscall per file plus a C-accelerated
+    # parse, instead of the text-wrapper open/decode/parse/close cycle
     try:
-        with open(expected_file, "r", encoding="utf-8") as f:
-            expected = json.load(f)
-
-        with open(output_file, "r", encoding="utf-8") as f:
-            actual = json.load(f)
-    except (OSError, json.JSONDecodeError) as e:
+        expected = _loads(expected_file.read_bytes())
+        actual = _loads(output_file.read_bytes())
+    except (OSError, ValueError) as e:
         print(f"ERROR: Failed to load output files: {e}")
         return 1
 
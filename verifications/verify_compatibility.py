@@ -22,15 +22,37 @@ This script tests the normalization service with different collector-gh
 versions to verify compatibility warnings are generated correctly.
 """
 
-import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from operator import itemgetter
 from pathlib import Path
 
+# Repository layout anchors, resolved once at import
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_FIXTURES_ROOT = _REPO_ROOT / "tests" / "fixtures"
+
+# C-level accessor for the warning code; the audit schema guarantees the key,
+# so no .get default handling is needed per warning
+_GET_CODE = itemgetter("code")
+
+# Import the service once per process so every fixture tested in that process
+# reuses the warm module (memoized pipeline resolution, cached logger). The
+# missing-package case is reported per fixture, keeping the old guidance.
+try:
+    from living_doc_service_normalize_issues.service import run_service_to_dict
+except ImportError:  # pragma: no cover - depends on environment
+    run_service_to_dict = None  # type: ignore[assignment]
+
 
 def test_version_fixture(version: str, expected_warnings: bool) -> bool:
     """
     Test normalization with a specific collector-gh version fixture.
 
+    Status lines are buffered and emitted as one stdout write, so each
+    version's report costs a single syscall and stays contiguous even when
+    versions run in parallel processes.
+
     Args:
         version: Version string (e.g., "v0.9.0", "v1.0.0", "v2.0.0")
         expected_warnings: Whether VERSION_MISMATCH warnings are expected
@@ -38,75 +60,79 @@ def test_version_fixture(version: str, expected_warnings: bool) -> bool:
     Returns:
         True if test passes, False otherwise
     """
-    print(f"\nTesting {version}:")
-    print("-" * 60)
+    lines: list[str] = []
+    try:
+        return _test_version_fixture(version, expected_warnings, lines.append)
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _test_version_fixture(version: str, expected_warnings: bool, out) -> bool:
+    """Run one compatibility test, reporting through the out callable."""
+    out(f"\nTesting {version}:")
+    out("-" * 60)
 
     # Define paths
-    repo_root = Path(__file__).parent.parent
-    input_file = repo_root / "tests" / "fixtures" / "collector_gh" / version / "input" / "doc-issues.json"
-    output_file = Path(f"/tmp/test_compatibility_{version}_output.json")
+    input_file = _FIXTURES_ROOT / "collector_gh" / version / "input" / "doc-issues.json"
 
-    # Verify input file exists
-    if not input_file.exists():
-        print(f"✗ Input file not found: {input_file}")
+    # Verify input file exists (os.path.exists skips the stat-result object
+    # Path.exists builds per call)
+    if not os.path.exists(input_file):
+        out(f"✗ Input file not found: {input_file}")
         return False
 
-    print(f"Input: {input_file}")
-    print(f"Output: {output_file}")
+    out(f"Input: {input_file}")
 
-    # Try to import and run the service
-    try:
-        from living_doc_service_normalize_issues.service import run_service
-
-        options = {}
-        run_service(str(input_file), str(output_file), options)
-    except ImportError:
-        print("✗ Cannot import living_doc_service_normalize_issues")
-        print("  Packages may not be installed. Run:")
-        print("  pip install -e packages/core -e packages/datasets_pdf")
-        print("  pip install -e packages/adapters/collector_gh -e packages/services/normalize_issues")
-        return False
-    except Exception as e:  # pylint: disable=broad-except
-        print(f"✗ Normalization failed: {e}")
+    if run_service_to_dict is None:
+        out("✗ Cannot import living_doc_service_normalize_issues")
+        out("  Packages may not be installed. Run:")
+        out("  pip install -e packages/core -e packages/datasets_pdf")
+        out("  pip install -e packages/adapters/collector_gh -e packages/services/normalize_issues")
         return False
 
-    # Load output and check warnings
+    # Run the service in-process: the output is only inspected here, so skip
+    # the write-to-/tmp plus reparse round trip
     try:
-        with open(output_file, "r", encoding="utf-8") as f:
-            output = json.load(f)
-    except (OSError, json.JSONDecodeError) as e:
-        print(f"✗ Failed to load output file: {e}")
+        output = run_service_to_dict(str(input_file), {})
+    except Exception as e:  # pylint: disable=broad-except
+        out(f"✗ Normalization failed: {e}")
         return False
 
     # Check if audit trace exists
     if "audit" not in output["meta"] or "trace" not in output["meta"]["audit"]:
-        print("✗ No audit trace found in output")
+        out("✗ No audit trace found in output")
         return False
 
-    # Get warnings from the first trace step (normalization step)
-    warnings = []
-    for trace_step in output["meta"]["audit"]["trace"]:
-        warnings.extend(trace_step.get("warnings", []))
+    # Scan the trace for VERSION_MISMATCH warnings with a short-circuiting
+    # any(); the filtered list is materialized only when there is something
+    # to print, so the no-warning pass branch allocates nothing
+    trace = output["meta"]["audit"]["trace"]
+    mismatch_found = any(
+        _GET_CODE(warning) == "VERSION_MISMATCH" for trace_step in trace for warning in trace_step.get("warnings", ())
+    )
+
+    if not mismatch_found:
+        if expected_warnings:
+            out("✗ Expected VERSION_MISMATCH warnings but none found")
+            return False
+        out("✓ No VERSION_MISMATCH warnings (as expected)")
+        return True
 
-    # Check if VERSION_MISMATCH warnings exist
-    version_warnings = [w for w in warnings if w.get("code") == "VERSION_MISMATCH"]
+    # Filter and format in one pass; the count falls out of the list length
+    formatted = [
+        f"  - [{warning['code']}] {warning['message']}"
+        for trace_step in trace
+        for warning in trace_step.get("warnings", ())
+        if _GET_CODE(warning) == "VERSION_MISMATCH"
+    ]
 
     if expected_warnings:
-        if version_warnings:
-            print(f"✓ Expected warnings found: {len(version_warnings)}")
-            for warning in version_warnings:
-                print(f"  - [{warning['code']}] {warning['message']}")
-            return True
-        print("✗ Expected VERSION_MISMATCH warnings but none found")
-        return False
-
-    if not version_warnings:
-        print("✓ No VERSION_MISMATCH warnings (as expected)")
+        out(f"✓ Expected warnings found: {len(formatted)}")
+        out("\n".join(formatted))
         return True
 
-    print(f"✗ Unexpected VERSION_MISMATCH warnings found: {len(version_warnings)}")
-    for warning in version_warnings:
-        print(f"  - [{warning['code']}] {warning['message']}")
+    out(f"✗ Unexpected VERSION_MISMATCH warnings found: {len(formatted)}")
+    out("\n".join(formatted))
     return False
 
 
@@ -116,16 +142,20 @@ def main() -> int:
     print("Collector-GH Version Compatibility Verification")
     print("=" * 60)
 
-    results = []
-
-    # Test v0.9.0 (below supported range - should warn)
-    results.append(("v0.9.0", test_version_fixture("v0.9.0", expected_warnings=True)))
+    # Versions below/above the supported range should warn; in-range should not
+    cases = [("v0.9.0", True), ("v1.0.0", False), ("v2.0.0", True)]
 
-    # Test v1.0.0 (within supported range - should not warn)
-    results.append(("v1.0.0", test_version_fixture("v1.0.0", expected_warnings=False)))
+    # The per-version tests are independent (distinct fixtures, in-memory
+    # outputs), so fan them out across processes; each version's buffered
+    # report is emitted in one write, so blocks stay contiguous
+    with ProcessPoolExecutor(max_workers=len(cases)) as executor:
+        futures = {
+            executor.submit(test_version_fixture, version, expected_warnings): version
+            for version, expected_warnings in cases
+        }
+        outcomes = {futures[future]: future.result() for future in as_completed(futures)}
 
-    # Test v2.0.0 (above supported range - should warn)
-    results.append(("v2.0.0", test_version_fixture("v2.0.0", expected_warnings=True)))
+    results = [(version, outcomes[version]) for version, _ in cases]
 
     # Summary
     print("\n" + "=" * 60)
@@ -22,101 +22,174 @@ This script runs the normalization service with golden input fixtures
 and compares the output to expected golden output files.
 """
 
+import functools
 import json
+import os
+import re
 import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 
+try:
+    import orjson
 
-def normalize_timestamps(data: dict) -> None:
-    """Remove dynamic timestamps for comparison."""
-    if "meta" in data:
-        data["meta"]["generated_at"] = "DYNAMIC_TIMESTAMP"
-        if data["meta"].get("audit"):
-            for trace_step in data["meta"]["audit"]["trace"]:
-                if trace_step.get("started_at"):
-                    trace_step["started_at"] = "DYNAMIC_TIMESTAMP"
-                if trace_step.get("finished_at"):
-                    trace_step["finished_at"] = "DYNAMIC_TIMESTAMP"
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None  # type: ignore[assignment]
+    _loads = json.loads
+
+# Repository layout anchors, resolved once at import
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+_FIXTURES_ROOT = _REPO_ROOT / "tests" / "fixtures"
+
+# Masks the dynamic timestamp fields at the byte level, matching the
+# "DYNAMIC_TIMESTAMP" placeholders stored in the golden files
+_TIMESTAMP_RE = re.compile(rb'"(generated_at|started_at|finished_at)": "[^"]*"')
+
+
+def _mask_timestamps(raw: bytes) -> bytes:
+    """Replace dynamic timestamp values with the DYNAMIC_TIMESTAMP placeholder."""
+    return _TIMESTAMP_RE.sub(rb'"\1": "DYNAMIC_TIMESTAMP"', raw)
+
+
+def _canonical(data: dict) -> bytes:
+    """Serialize a document to canonical sorted-key bytes for comparison."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(data, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=None)
+def _expected_canonical(path: str) -> bytes:
+    """Canonical bytes of an expected-golden file, cached per path."""
+    return _canonical(_load_expected(path))
+
+
+@functools.lru_cache(maxsize=None)
+def _load_expected(path: str) -> dict:
+    """
+    Load and cache a parsed expected-golden file.
+
+    Each golden file is parsed once per process; repeated runs against the
+    same fixture (and any future fixtures sharing an expected file) reuse the
+    decoded tree. Callers must treat the returned dict as read-only.
+
+    Args:
+        path: Path to the expected output JSON file
+
+    Returns:
+        Parsed expected output document
+    """
+    return _loads(Path(path).read_bytes())
 
 
 def run_golden_test(version: str) -> bool:
     """
     Run golden file test for a specific version.
 
+    Status lines are buffered and emitted as one stdout write, so each
+    version's report costs a single syscall and stays contiguous even when
+    versions run in parallel processes.
+
     Args:
         version: Version string (e.g., "v1.0.0")
 
     Returns:
         True if test passes, False otherwise
     """
-    print(f"\nTesting {version}:")
-    print("-" * 60)
+    lines: list[str] = []
+    try:
+        return _run_golden_test(version, lines.append)
+    finally:
+        sys.stdout.write("\n".join(lines) + "\n")
+
+
+def _run_golden_test(version: str, out) -> bool:
+    """Run one golden file test, reporting through the out callable."""
+    out(f"\nTesting {version}:")
+    out("-" * 60)
 
     # Define paths
-    repo_root = Path(__file__).parent.parent
-    input_file = repo_root / "tests" / "fixtures" / "collector_gh" / version / "input" / "doc-issues.json"
-    expected_file = repo_root / "tests" / "fixtures" / "golden" / version / "expected_output.json"
+    input_file = _FIXTURES_ROOT / "collector_gh" / version / "input" / "doc-issues.json"
+    expected_file = _FIXTURES_ROOT / "golden" / version / "expected_output.json"
     output_file = Path(f"/tmp/verify_golden_{version}_output.json")
 
-    # Verify input file exists
-    if not input_file.exists():
-        print(f"✗ Input file not found: {input_file}")
+    # Verify fixture files exist (os.path.exists skips the stat-result
+    # object Path.exists builds per call)
+    if not os.path.exists(input_file):
+        out(f"✗ Input file not found: {input_file}")
         return False
 
-    # Verify expected output file exists
-    if not expected_file.exists():
-        print(f"✗ Expected output file not found: {expected_file}")
+    if not os.path.exists(expected_file):
+        out(f"✗ Expected output file not found: {expected_file}")
         return False
 
-    print(f"Input: {input_file}")
-    print(f"Expected: {expected_file}")
-    print(f"Output: {output_file}")
+    out(f"Input: {input_file}")
+    out(f"Expected: {expected_file}")
+    out(f"Output: {output_file}")
 
     # Try to import and run the service
     try:
         from living_doc_service_normalize_issues.service import run_service
 
+        # No cache_dir here: the service's content-hash cache keys on input
+        # bytes and options only, so a cached copy would mask code regressions
+        # — this script must run the real pipeline every time.
         options = {
             "document_title": f"Living Documentation - {version} Test",
             "document_version": version.replace("v", ""),
         }
         run_service(str(input_file), str(output_file), options)
     except ImportError:
-        print("✗ Cannot import living_doc_service_normalize_issues")
-        print("  Packages may not be installed. Run:")
-        print("  pip install -e packages/core -e packages/datasets_pdf")
-        print("  pip install -e packages/adapters/collector_gh -e packages/services/normalize_issues")
+        out("✗ Cannot import living_doc_service_normalize_issues")
+        out("  Packages may not be installed. Run:")
+        out("  pip install -e packages/core -e packages/datasets_pdf")
+        out("  pip install -e packages/adapters/collector_gh -e packages/services/normalize_issues")
         return False
     except Exception as e:  # pylint: disable=broad-except
-        print(f"✗ Normalization failed: {e}")
+        out(f"✗ Normalization failed: {e}")
         return False
 
-    # Load outputs
+    # Byte-level fast path: mask the dynamic timestamps in the raw output and
+    # compare directly against the expected bytes, skipping both parses when
+    # the writer's layout matches the fixture exactly
     try:
-        with open(expected_file, "r", encoding="utf-8") as f:
-            expected = json.load(f)
-
-        with open(output_file, "r", encoding="utf-8") as f:
-            actual = json.load(f)
-    except (OSError, json.JSONDecodeError) as e:
-        print(f"✗ Failed to load output files: {e}")
+        masked_actual = _mask_timestamps(output_file.read_bytes())
+        byte_match = masked_actual == expected_file.read_bytes()
+    except OSError as e:
+        out(f"✗ Failed to load output files: {e}")
         return False
 
-    # Normalize timestamps
-    normalize_timestamps(actual)
+    if not byte_match:
+        # Fall back to a parsed deep-compare, which tolerates pure formatting
+        # differences (e.g. ASCII-escaped fixtures) and gives a real verdict.
+        # The timestamps are already masked at the byte level, so no Python
+        # traversal of the parsed tree is needed; both sides reduce to
+        # canonical sorted-key bytes and compare with a single memcmp instead
+        # of a recursive dict equality walk.
+        try:
+            actual = _loads(masked_actual)
+        except ValueError as e:
+            out(f"✗ Failed to load output files: {e}")
+            return False
+
+        byte_match = _canonical(actual) == _expected_canonical(str(expected_file))
 
     # Compare
-    if actual == expected:
-        print(f"✓ Output matches expected golden file")
-        print(f"  - User stories: {len(actual['content']['user_stories'])}")
-        print(f"  - Document title: {actual['meta']['document_title']}")
-        print(f"  - Document version: {actual['meta']['document_version']}")
+    if byte_match:
+        # The documents are equal, so the cached expected tree serves the
+        # summary without parsing the output
+        actual = _load_expected(str(expected_file))
+        out(f"✓ Output matches expected golden file")
+        out(f"  - User stories: {len(actual['content']['user_stories'])}")
+        out(f"  - Document title: {actual['meta']['document_title']}")
+        out(f"  - Document version: {actual['meta']['document_version']}")
         return True
 
-    print("✗ Output does NOT match expected golden file")
-    print()
-    print("To see differences, run:")
-    print(f"  diff {expected_file} {output_file}")
+    out("✗ Output does NOT match expected golden file")
+    out("")
+    out("To see differences, run:")
+    out(f"  diff {expected_file} {output_file}")
     return False
 
 
@@ -126,13 +199,16 @@ def main() -> int:
     print("Golden File Verification")
     print("=" * 60)
 
-    results = []
+    versions = ["v1.0.0", "v1.2.0"]
 
-    # Test v1.0.0
-    results.append(("v1.0.0", run_golden_test("v1.0.0")))
+    # The per-version tests are independent (distinct fixtures, distinct /tmp
+    # output paths), so fan them out across processes; each version's buffered
+    # report is emitted in one write, so blocks stay contiguous
+    with ProcessPoolExecutor(max_workers=len(versions)) as executor:
+        futures = {executor.submit(run_golden_test, version): version for version in versions}
+        outcomes = {futures[future]: future.result() for future in as_completed(futures)}
 
-    # Test v1.2.0
-    results.append(("v1.2.0", run_golden_test("v1.2.0")))
+    results = [(version, outcomes[version]) for version in versions]
 
     # Summary
     print("\n" + "=" * 60)